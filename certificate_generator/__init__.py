@@ -5,16 +5,38 @@ A comprehensive tool for generating personalized Junior Achievement certificates
 from various input file formats.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "JA Certificate Completion Project"
 __license__ = "MIT"
 
-from .file_reader import StudentNameExtractor
-from .certificate_generator import CertificateGenerator
-from . import cli
+__all__ = ["StudentNameExtractor", "CertificateGenerator", "cli", "PrinterManager"]
+
+# Public names and the submodules that define them. They are imported on
+# first access so that light commands (such as listing printers) do not
+# load ReportLab and PyPDF2.
+_LAZY_ATTRIBUTES = {
+    "StudentNameExtractor": ".file_reader",
+    "CertificateGenerator": ".certificate_generator",
+    "PrinterManager": ".printer",
+}
 
-try:
+if TYPE_CHECKING:
+    # Static imports for type checkers and PyInstaller's dependency analysis
+    from .file_reader import StudentNameExtractor
+    from .certificate_generator import CertificateGenerator
     from .printer import PrinterManager
-    __all__ = ["StudentNameExtractor", "CertificateGenerator", "cli", "PrinterManager"]
-except ImportError:
-    __all__ = ["StudentNameExtractor", "CertificateGenerator", "cli"]
\ No newline at end of file
+    from . import cli
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access."""
+    if name == "cli":
+        return importlib.import_module(".cli", __name__)
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,21 @@ Handles PDF creation and text overlay for personalized certificates.
 """
 
 from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import (
+    ArrayObject, DecodedStreamObject, DictionaryObject, IndirectObject, NameObject, NumberObject, StreamObject
+)
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib.colors import black
 import io
 import os
+import string
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import BinaryIO, List, Optional, Dict, Tuple
 
 try:
     from .printer import PrinterManager
@@ -30,11 +38,397 @@ def get_resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+def _overlay_form(overlay_page):
+    """Wrap an overlay page's content in a Form XObject, or return None if it is empty."""
+    overlay_contents = overlay_page.get(NameObject('/Contents'))
+    if overlay_contents is None:
+        return None
+    overlay_contents = overlay_contents.get_object()
+    if isinstance(overlay_contents, ArrayObject):
+        data = b"\n".join(part.get_object().get_data() for part in overlay_contents)
+    else:
+        data = overlay_contents.get_data()
+    
+    form = DecodedStreamObject()
+    form.set_data(data)
+    form[NameObject('/Type')] = NameObject('/XObject')
+    form[NameObject('/Subtype')] = NameObject('/Form')
+    form[NameObject('/BBox')] = overlay_page.mediabox
+    return form
+
+
+def _free_xobject_name(xobjects):
+    """Pick an /OverlayN name that is not already used in an /XObject dictionary."""
+    index = 0
+    while f"/Overlay{index}" in xobjects:
+        index += 1
+    return NameObject(f"/Overlay{index}")
+
+
+def _stamp_streams(form_name):
+    """Content streams that isolate a page's graphics state and then paint form_name."""
+    prefix = DecodedStreamObject()
+    prefix.set_data(b"q\n")
+    suffix = DecodedStreamObject()
+    suffix.set_data(b"\nQ\nq " + form_name.encode() + b" Do Q\n")
+    return prefix, suffix
+
+
+def stamp_overlay(writer, page, overlay_page):
+    """
+    Draw overlay_page on top of a page that has already been added to writer.
+    
+    Unlike PageObject.merge_page, neither content stream is parsed or rewritten:
+    the overlay is wrapped in a Form XObject and the page's existing content
+    streams are bracketed with small q/Q streams that paint it.
+    
+    Args:
+        writer: PdfWriter that owns page
+        page: Page returned by writer.add_page()
+        overlay_page: Page to draw on top, e.g. from a reportlab overlay
+    """
+    form = _overlay_form(overlay_page)
+    if form is None:
+        return
+    if '/Resources' in overlay_page:
+        form[NameObject('/Resources')] = overlay_page['/Resources'].clone(writer)
+    
+    # Register the form under a name not already used by the page
+    if '/Resources' not in page:
+        page[NameObject('/Resources')] = DictionaryObject()
+    resources = page['/Resources'].get_object()
+    if '/XObject' not in resources:
+        resources[NameObject('/XObject')] = DictionaryObject()
+    xobjects = resources['/XObject'].get_object()
+    form_name = _free_xobject_name(xobjects)
+    xobjects[form_name] = writer._add_object(form)
+    
+    # Isolate the page's graphics state, then paint the form on top
+    # Keep the content streams as references: a stream placed directly in
+    # the /Contents array would make the file invalid
+    contents = page.raw_get('/Contents') if '/Contents' in page else ArrayObject()
+    if not isinstance(contents, ArrayObject) and isinstance(contents.get_object(), ArrayObject):
+        contents = contents.get_object()
+    if not isinstance(contents, ArrayObject):
+        if not isinstance(contents, IndirectObject):
+            contents = writer._add_object(contents)
+        contents = ArrayObject([contents])
+    
+    prefix, suffix = _stamp_streams(form_name)
+    page[NameObject('/Contents')] = ArrayObject(
+        [writer._add_object(prefix), *contents, writer._add_object(suffix)]
+    )
+
+
+class _IncrementalTemplateWriter:
+    """
+    Write stamped copies of a single-page template as PDF incremental updates.
+    
+    Each certificate is the untouched template file followed by a small update
+    section that replaces the page object and adds the overlay form (plus any
+    streams its resources refer to), so none of the template's objects are
+    re-serialized. Everything except the form, its streams and the
+    cross-reference section is identical for every student and is serialized
+    once.
+    """
+    
+    @classmethod
+    def from_template(cls, reader, template_bytes):
+        """Build a writer for the template, or return None if it cannot be updated in place."""
+        if reader.is_encrypted or len(reader.pages) != 1:
+            return None
+        if reader.pages[0].indirect_reference is None or template_bytes.rfind(b'startxref') < 0:
+            return None
+        return cls(reader, template_bytes)
+    
+    def __init__(self, reader, template_bytes):
+        page = reader.pages[0]
+        page_ref = page.indirect_reference
+        
+        # The update's xref section chains to the template's last one
+        marker = template_bytes.rfind(b'startxref')
+        self.prev_xref = int(template_bytes[marker + len(b'startxref'):].split()[0])
+        self.use_xref_stream = not template_bytes[self.prev_xref:].lstrip().startswith(b'xref')
+        
+        # New objects are numbered after every object the template defines
+        used = set(reader.xref_objStm)
+        for entries in reader.xref.values():
+            used.update(entries)
+        self.first_new = max(used) + 1
+        
+        self.trailer = DictionaryObject()
+        for key in ('/Root', '/Info', '/ID'):
+            if key in reader.trailer:
+                self.trailer[NameObject(key)] = reader.trailer.raw_get(key)
+        
+        # Replacement page: same object as before with a private /Resources
+        # copy that names the overlay form, and bracketed contents
+        resources = DictionaryObject(page['/Resources'].get_object()) if '/Resources' in page else DictionaryObject()
+        xobjects = DictionaryObject(resources['/XObject'].get_object()) if '/XObject' in resources else DictionaryObject()
+        self.form_name = _free_xobject_name(xobjects)
+        
+        prefix_num = self.first_new
+        suffix_num = self.first_new + 1
+        self.form_num = self.first_new + 2
+        xobjects[self.form_name] = IndirectObject(self.form_num, 0, None)
+        resources[NameObject('/XObject')] = xobjects
+        
+        contents = page.raw_get('/Contents') if '/Contents' in page else ArrayObject()
+        if not isinstance(contents, ArrayObject) and isinstance(contents.get_object(), ArrayObject):
+            contents = contents.get_object()
+        if not isinstance(contents, ArrayObject):
+            contents = ArrayObject([contents])
+        
+        new_page = DictionaryObject(page)
+        new_page[NameObject('/Resources')] = resources
+        new_page[NameObject('/Contents')] = ArrayObject(
+            [IndirectObject(prefix_num, 0, None), *contents, IndirectObject(suffix_num, 0, None)]
+        )
+        
+        head = io.BytesIO()
+        head.write(template_bytes)
+        if not template_bytes.endswith(b'\n'):
+            head.write(b'\n')
+        self.offsets = {}
+        prefix, suffix = _stamp_streams(self.form_name)
+        for num, gen, obj in ((page_ref.idnum, page_ref.generation, new_page),
+                              (prefix_num, 0, prefix), (suffix_num, 0, suffix)):
+            self.offsets[num] = (head.tell(), gen)
+            self._write_object(head, num, gen, obj)
+        self.head = head.getvalue()
+    
+    @staticmethod
+    def _write_object(stream, num, gen, obj):
+        stream.write(f"{num} {gen} obj\n".encode())
+        obj.write_to_stream(stream, None)
+        stream.write(b"\nendobj\n")
+    
+    def _localize(self, obj, streams):
+        """
+        Copy obj so that it only refers to objects written in this update.
+        
+        Referenced dictionaries and arrays are inlined. Referenced streams are
+        copied without re-encoding into streams, keyed by their overlay
+        reference, and numbered after the form.
+        """
+        if isinstance(obj, IndirectObject):
+            target = obj.get_object()
+            if not isinstance(target, StreamObject):
+                return self._localize(target, streams)
+            key = (obj.idnum, obj.generation)
+            if key not in streams:
+                num = self.form_num + 1 + len(streams)
+                copy = StreamObject()
+                streams[key] = (num, copy)
+                copy._data = target._data
+                for name, value in target.items():
+                    if name != '/Length':
+                        copy[name] = self._localize(value, streams)
+            return IndirectObject(streams[key][0], 0, None)
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: self._localize(value, streams) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._localize(value, streams) for value in obj)
+        return obj
+    
+    def render(self, overlay_page):
+        """Return the bytes of a certificate with overlay_page stamped on the template."""
+        form = _overlay_form(overlay_page)
+        if form is None:
+            form = DecodedStreamObject()
+            form[NameObject('/Type')] = NameObject('/XObject')
+            form[NameObject('/Subtype')] = NameObject('/Form')
+            form[NameObject('/BBox')] = overlay_page.mediabox
+        streams = {}
+        if '/Resources' in overlay_page:
+            form[NameObject('/Resources')] = self._localize(overlay_page['/Resources'], streams)
+        
+        out = io.BytesIO()
+        out.write(self.head)
+        offsets = dict(self.offsets)
+        offsets[self.form_num] = (out.tell(), 0)
+        self._write_object(out, self.form_num, 0, form)
+        for num, stream in streams.values():
+            offsets[num] = (out.tell(), 0)
+            self._write_object(out, num, 0, stream)
+        
+        size = self.form_num + 1 + len(streams)
+        if self.use_xref_stream:
+            self._write_xref_stream(out, offsets, size)
+        else:
+            self._write_xref_table(out, offsets, size)
+        return out.getvalue()
+    
+    @staticmethod
+    def _subsections(nums):
+        """Group sorted object numbers into (first, count) runs."""
+        runs = []
+        for num in nums:
+            if runs and runs[-1][0] + runs[-1][1] == num:
+                runs[-1][1] += 1
+            else:
+                runs.append([num, 1])
+        return runs
+    
+    def _trailer(self, size):
+        trailer = DictionaryObject(self.trailer)
+        trailer[NameObject('/Size')] = NumberObject(size)
+        trailer[NameObject('/Prev')] = NumberObject(self.prev_xref)
+        return trailer
+    
+    def _write_xref_table(self, out, offsets, size):
+        xref_offset = out.tell()
+        out.write(b"xref\n")
+        for first, count in self._subsections(sorted(offsets)):
+            out.write(f"{first} {count}\n".encode())
+            for num in range(first, first + count):
+                offset, gen = offsets[num]
+                out.write(f"{offset:010d} {gen:05d} n \n".encode())
+        out.write(b"trailer\n")
+        self._trailer(size).write_to_stream(out, None)
+        out.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+    
+    def _write_xref_stream(self, out, offsets, size):
+        xref_num = size
+        xref_offset = out.tell()
+        offsets[xref_num] = (xref_offset, 0)
+        
+        runs = self._subsections(sorted(offsets))
+        entries = bytearray()
+        for first, count in runs:
+            for num in range(first, first + count):
+                offset, gen = offsets[num]
+                entries += b"\x01" + offset.to_bytes(4, 'big') + gen.to_bytes(2, 'big')
+        
+        xref = DecodedStreamObject()
+        xref.set_data(bytes(entries))
+        xref.update(self._trailer(xref_num + 1))
+        xref[NameObject('/Type')] = NameObject('/XRef')
+        xref[NameObject('/W')] = ArrayObject([NumberObject(1), NumberObject(4), NumberObject(2)])
+        xref[NameObject('/Index')] = ArrayObject(NumberObject(n) for run in runs for n in run)
+        self._write_object(out, xref_num, 0, xref)
+        out.write(f"startxref\n{xref_offset}\n%%EOF\n".encode())
+
+
+# Maps every ASCII character that is not allowed in a filename, plus space, to '_'
+_FILENAME_ALLOWED = set(string.ascii_letters + string.digits + '_-')
+_FILENAME_TRANS = str.maketrans({c: '_' for c in map(chr, range(128)) if c not in _FILENAME_ALLOWED})
+
+
+# Rendered certificates held in memory before being written out together
+_WRITE_BATCH_SIZE = 64
+
+# Threads used to write a batch of rendered certificates to disk
+_WRITE_THREADS = 8
+
+
+def _write_file(output_path, data):
+    """Write data to output_path, returning the error instead of raising it."""
+    try:
+        with open(output_path, 'wb') as output_file:
+            output_file.write(data)
+        return None
+    except OSError as e:
+        return e
+
+
+class BatchPdfWriter:
+    """
+    Collect rendered PDFs in memory and write them to disk together.
+    
+    Pending files are written concurrently by a thread pool that is kept for
+    the writer's lifetime, either on flush() or once batch_size files are
+    waiting. Use as a context manager so the pool is shut down.
+    """
+    
+    def __init__(self, batch_size=_WRITE_BATCH_SIZE, threads=_WRITE_THREADS):
+        self.batch_size = batch_size
+        self.threads = threads
+        self._pending: List[Tuple[str, bytes, object]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def add(self, output_path, data, key=None):
+        """
+        Queue data to be written to output_path.
+        
+        Returns:
+            The flush() results if this filled the batch, otherwise an empty list
+        """
+        self._pending.append((output_path, data, key))
+        if len(self._pending) >= self.batch_size:
+            return self.flush()
+        return []
+    
+    def flush(self):
+        """
+        Write every queued file.
+        
+        Returns:
+            List of (key, output_path, error) in the order the files were
+            added, where error is the OSError raised or None on success
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads)
+        errors = self._executor.map(_write_file, [path for path, _, _ in pending],
+                                    [data for _, data, _ in pending])
+        return [(key, path, error) for (path, _, key), error in zip(pending, errors)]
+    
+    def close(self):
+        """Write anything still queued and shut down the thread pool."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# Overlay streams are a few hundred bytes of text operators and are copied into
+# each certificate as-is; compressing them costs more time than it saves space
+_OVERLAY_COMPRESSION = 0
+
+
+# A certificate takes about a millisecond to generate in-process while a
+# spawned pool takes around half a second to start, so a pool (used only
+# when workers are requested) needs roughly a thousand students to pay off
+_PARALLEL_MIN_STUDENTS = 1000
+
+
+# Generator built once in each process pool worker by _init_worker()
+_worker_generator = None
+
+
+def _init_worker(positions, school_name, date, ja_volunteer, teacher, template_bytes):
+    """Process pool initializer: set up this worker's generator from picklable arguments."""
+    global _worker_generator
+    
+    _worker_generator = CertificateGenerator(school_name=school_name, date=date,
+                                             ja_volunteer=ja_volunteer, teacher=teacher,
+                                             template_bytes=template_bytes)
+    _worker_generator.positions = positions
+
+
+def _generate_chunk(jobs):
+    """Process pool worker: generate a chunk of certificates with the worker's generator."""
+    return list(_worker_generator._generate_batch(jobs))
+
+
 class CertificateGenerator:
     """Generate personalized certificates from templates."""
     
+    # Fields whose text is the same on every certificate in a run
+    _STATIC_FIELDS = ('school_name', 'date', 'ja_volunteer', 'teacher')
+    
     def __init__(self, template_path=None, school_name="Andrew Jackson Elementary School", 
-                 date="19 November 2025", ja_volunteer=None, teacher=None):
+                 date="19 November 2025", ja_volunteer=None, teacher=None, template_bytes=None):
         """
         Initialize certificate generator.
         
@@ -44,8 +438,11 @@ class CertificateGenerator:
             date: Date for the certificate
             ja_volunteer: Optional JA Volunteer name
             teacher: Optional Teacher name
+            template_bytes: Optional contents of the PDF template, used instead
+                of reading template_path
         """
         self.template_path = template_path
+        self.template_bytes = template_bytes
         self.school_name = school_name
         self.date = date
         self.ja_volunteer = ja_volunteer
@@ -59,6 +456,21 @@ class CertificateGenerator:
             'ja_volunteer': {'x': 380, 'y': 182, 'font': 'Times-Italic', 'size': 14},
             'teacher': {'x': 645, 'y': 182, 'font': 'Times-Italic', 'size': 14}
         }
+        
+        # Load font metrics up front so every overlay hits a warm cache
+        for pos in self.positions.values():
+            pdfmetrics.getFont(pos['font'])
+        
+        # Parsed template, populated on first use by _load_template()
+        self._template_cache = None
+        self._incremental_writer = None
+        
+        # Scratch buffer that every overlay batch is rendered into
+        self._overlay_buffer = io.BytesIO()
+        
+        # Widths of static field text keyed by (text, font, size), so changing
+        # a field's text or font measures it afresh on the next overlay
+        self._static_width_cache: Dict[Tuple[str, str, float], float] = {}
     
     def _get_template_path(self):
         """Get the correct template path for both development and executable."""
@@ -79,91 +491,214 @@ class CertificateGenerator:
         
         raise FileNotFoundError(f"Certificate template not found at {default_template} or {fallback_template}")
     
+    def _load_template(self):
+        """
+        Read and parse the template PDF once and cache it on the instance.
+        
+        Returns:
+            Tuple of (reader, page_width, page_height, template_bytes)
+        """
+        if self._template_cache is None and self.template_bytes is not None:
+            self._set_template_bytes(self.template_bytes)
+        
+        if self._template_cache is None:
+            # Get template path (handles both bundled executable and development)
+            template_path = self._get_template_path()
+            if not os.path.exists(template_path):
+                raise FileNotFoundError(f"Template file not found: {template_path}")
+            
+            with open(template_path, 'rb') as template_file:
+                self._set_template_bytes(template_file.read())
+        
+        return self._template_cache
+    
+    def _set_template_bytes(self, template_bytes):
+        """Seed the template cache from the raw bytes of a template PDF."""
+        reader = PdfReader(io.BytesIO(template_bytes))
+        
+        # Get the first page (assuming single page certificate)
+        mediabox = reader.pages[0].mediabox
+        self._template_cache = (reader, float(mediabox.width), float(mediabox.height), template_bytes)
+        self._incremental_writer = _IncrementalTemplateWriter.from_template(reader, template_bytes)
+    
+    def _static_fields(self):
+        """Return (field, text, width) for every static field that has text."""
+        fields = []
+        for field in self._STATIC_FIELDS:
+            text = getattr(self, field)
+            if text:
+                pos = self.positions[field]
+                key = (text, pos['font'], pos['size'])
+                text_width = self._static_width_cache.get(key)
+                if text_width is None:
+                    text_width = self._static_width_cache[key] = stringWidth(*key)
+                fields.append((field, text, text_width))
+        return fields
+    
+    def _draw_fields(self, can, fields):
+        """
+        Draw (field, text, width) entries centered on their configured positions.
+        
+        Fields are drawn grouped by font and size so that setFont is only
+        emitted when the font actually changes.
+        """
+        can.setFillColor(black)
+        current_font = None
+        for field, text, text_width in sorted(
+            fields, key=lambda entry: (self.positions[entry[0]]['font'], self.positions[entry[0]]['size'])
+        ):
+            pos = self.positions[field]
+            if (pos['font'], pos['size']) != current_font:
+                current_font = (pos['font'], pos['size'])
+                can.setFont(*current_font)
+            can.drawString(pos['x'] - text_width/2, pos['y'], text)
+    
+    def _name_field(self, student_name):
+        """Return the (field, text, width) entry for a student's name."""
+        pos = self.positions['student_name']
+        return ('student_name', student_name, stringWidth(student_name, pos['font'], pos['size']))
+    
+    def _draw_certificate_text(self, can, student_name):
+        """Draw the student information for one certificate onto the current page."""
+        self._draw_fields(can, [self._name_field(student_name), *self._static_fields()])
+    
     def create_text_overlay(self, student_name, page_width, page_height):
         """Create a PDF overlay with the student information."""
         packet = io.BytesIO()
-        can = canvas.Canvas(packet, pagesize=(page_width, page_height))
-        
-        # Student name
-        pos = self.positions['student_name']
-        can.setFont(pos['font'], pos['size'])
-        can.setFillColor(black)
-        text_width = can.stringWidth(student_name, pos['font'], pos['size'])
-        can.drawString(pos['x'] - text_width/2, pos['y'], student_name)
-        
-        # School name
-        pos = self.positions['school_name']
-        can.setFont(pos['font'], pos['size'])
-        text_width = can.stringWidth(self.school_name, pos['font'], pos['size'])
-        can.drawString(pos['x'] - text_width/2, pos['y'], self.school_name)
-        
-        # Date
-        pos = self.positions['date']
-        can.setFont(pos['font'], pos['size'])
-        text_width = can.stringWidth(self.date, pos['font'], pos['size'])
-        can.drawString(pos['x'] - text_width/2, pos['y'], self.date)
-        
-        # JA Volunteer (optional)
-        if self.ja_volunteer:
-            pos = self.positions['ja_volunteer']
-            can.setFont(pos['font'], pos['size'])
-            text_width = can.stringWidth(self.ja_volunteer, pos['font'], pos['size'])
-            can.drawString(pos['x'] - text_width/2, pos['y'], self.ja_volunteer)
-        
-        # Teacher (optional)
-        if self.teacher:
-            pos = self.positions['teacher']
-            can.setFont(pos['font'], pos['size'])
-            text_width = can.stringWidth(self.teacher, pos['font'], pos['size'])
-            can.drawString(pos['x'] - text_width/2, pos['y'], self.teacher)
-        
+        can = canvas.Canvas(packet, pagesize=(page_width, page_height), pageCompression=_OVERLAY_COMPRESSION)
+        self._draw_certificate_text(can, student_name)
         can.save()
         packet.seek(0)
         return packet
     
-    def generate_single_certificate(self, student_name, output_path):
-        """Generate a personalized certificate for a single student."""
+    def _build_overlay_batch(self, student_names, page_width, page_height):
+        """
+        Render the overlays for many students as the pages of one PDF.
+        
+        The fields shared by every student are drawn once into a form that
+        each page reuses, so only the name is drawn per page.
+        
+        Returns:
+            PDF bytes with one overlay page per student, in order
+        """
+        packet = self._overlay_buffer
+        packet.seek(0)
+        packet.truncate(0)
+        can = canvas.Canvas(packet, pagesize=(page_width, page_height), pageCompression=_OVERLAY_COMPRESSION)
+        can.beginForm('static_overlay')
+        self._draw_fields(can, self._static_fields())
+        can.endForm()
+        for student_name in student_names:
+            self._draw_fields(can, [self._name_field(student_name)])
+            can.doForm('static_overlay')
+            can.showPage()
+        can.save()
+        return packet.getvalue()
+    
+    def _render_certificate(self, overlay_page):
+        """Stamp an overlay page onto a copy of the template page and return the PDF bytes."""
+        reader, _, _, _ = self._load_template()
+        
+        # Append the overlay to the template as an incremental update when possible
+        if self._incremental_writer is not None:
+            return self._incremental_writer.render(overlay_page)
+        
+        # Reuse the parsed template; add_page() gives the writer its own copy
+        writer = PdfWriter()
+        page = writer.add_page(reader.pages[0])
+        stamp_overlay(writer, page, overlay_page)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+    
+    def generate_single_certificate(self, student_name, output_path, out: Optional[BinaryIO] = None):
+        """
+        Generate a personalized certificate for a single student.
+        
+        Args:
+            student_name: Name to put on the certificate
+            output_path: File to write; its directory must already exist
+            out: Optional binary stream to write the PDF to instead of output_path
+        """
         try:
-            # Get template path (handles both bundled executable and development)
-            template_path = self._get_template_path()
-            if not os.path.exists(template_path):
-                raise FileNotFoundError(f"Template file not found: {template_path}")
-            
-            # Read the template PDF
-            reader = PdfReader(template_path)
-            writer = PdfWriter()
-            
-            # Get the first page (assuming single page certificate)
-            template_page = reader.pages[0]
-            page_width = float(template_page.mediabox.width)
-            page_height = float(template_page.mediabox.height)
+            _, page_width, page_height, _ = self._load_template()
             
             # Create text overlay
             overlay_packet = self.create_text_overlay(student_name, page_width, page_height)
-            overlay_reader = PdfReader(overlay_packet)
-            overlay_page = overlay_reader.pages[0]
-            
-            # Merge the overlay with the template
-            template_page.merge_page(overlay_page)
-            writer.add_page(template_page)
+            overlay_page = PdfReader(overlay_packet).pages[0]
+            data = self._render_certificate(overlay_page)
             
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            # Write the output PDF
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
-                
+            if out is not None:
+                out.write(data)
+            else:
+                with open(output_path, 'wb') as output_file:
+                    output_file.write(data)
             return True
             
         except Exception as e:
             print(f"Error generating certificate for {student_name}: {str(e)}")
             return False
     
-    def generate_bulk_certificates(self, student_names, output_dir=None, print_certificates=False, printer_name=None):
-        """Generate certificates for multiple students."""
+    def _generate_batch(self, jobs):
+        """
+        Generate certificates for (student_name, output_path) jobs in this process.
+        
+        All overlays are rendered into a single multi-page PDF that is parsed
+        once, instead of one canvas and one PdfReader per student. Rendered
+        certificates are kept in memory and written out in batches by a small
+        thread pool rather than one file at a time between renders.
+        
+        Yields:
+            Tuples of (success, output_path, student_name) in job order
+        """
+        try:
+            _, page_width, page_height, _ = self._load_template()
+            overlay_bytes = self._build_overlay_batch([name for name, _ in jobs], page_width, page_height)
+            overlay_pages = PdfReader(io.BytesIO(overlay_bytes)).pages
+        except Exception:
+            # Fall back to one at a time so each student reports its own error
+            for student_name, output_path in jobs:
+                yield self.generate_single_certificate(student_name, output_path), output_path, student_name
+            return
+        
+        with BatchPdfWriter() as writer:
+            for (student_name, output_path), overlay_page in zip(jobs, overlay_pages):
+                try:
+                    data = self._render_certificate(overlay_page)
+                except Exception as e:
+                    # Report the students queued ahead of this one first to keep job order
+                    yield from self._report_writes(writer.flush())
+                    print(f"Error generating certificate for {student_name}: {str(e)}")
+                    yield False, output_path, student_name
+                    continue
+                
+                yield from self._report_writes(writer.add(output_path, data, student_name))
+            
+            yield from self._report_writes(writer.flush())
+    
+    def _report_writes(self, results):
+        """
+        Turn BatchPdfWriter results keyed by student name into job results.
+        
+        Yields:
+            Tuples of (success, output_path, student_name) in the order given
+        """
+        for student_name, output_path, error in results:
+            if error is not None:
+                print(f"Error generating certificate for {student_name}: {str(error)}")
+            yield error is None, output_path, student_name
+    
+    def generate_bulk_certificates(self, student_names, output_dir=None, print_certificates=False, printer_name=None,
+                                   max_workers=None, choose_printer=False):
+        """
+        Generate certificates for multiple students.
+        
+        Args:
+            max_workers: Processes to spread classes of 1000 or more students
+                across (default: generate in this process)
+            choose_printer: Without printer_name, list the printers to choose from
+                instead of using the default printer
+        """
         if not student_names:
             raise ValueError("No student names provided")
         
@@ -172,19 +707,20 @@ class CertificateGenerator:
             output_dir = "certificates"
         
         # Create output directory if it doesn't exist
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        os.makedirs(output_dir, exist_ok=True)
         
         successful = 0
         failed = 0
         generated_files = []
         
+        jobs = []
         for student_name in student_names:
             # Create safe filename from student name
             safe_filename = self._create_safe_filename(student_name)
-            output_path = os.path.join(output_dir, f"{safe_filename}_Certificate.pdf")
-            
-            if self.generate_single_certificate(student_name, output_path):
+            jobs.append((student_name, os.path.join(output_dir, f"{safe_filename}_Certificate.pdf")))
+        
+        for success, output_path, student_name in self._run_jobs(jobs, max_workers):
+            if success:
                 print(f"Generated certificate for: {student_name}")
                 successful += 1
                 generated_files.append(output_path)
@@ -197,11 +733,59 @@ class CertificateGenerator:
         
         # Handle printing if requested
         if print_certificates and generated_files:
-            self._handle_printing(generated_files, printer_name)
+            self._handle_printing(generated_files, printer_name, choose_printer)
         
         return successful, failed
     
-    def _handle_printing(self, pdf_files: List[str], printer_name: Optional[str] = None):
+    def _run_jobs(self, jobs, max_workers=None):
+        """
+        Generate certificates for (student_name, output_path) jobs.
+        
+        Large runs are spread across a process pool when max_workers asks
+        for more than one process; everything else, and whatever is left if
+        the pool cannot start or breaks, is generated in this process.
+        
+        Yields:
+            Tuples of (success, output_path, student_name) in job order
+        """
+        template_bytes = None
+        
+        if max_workers and max_workers > 1 and len(jobs) < _PARALLEL_MIN_STUDENTS:
+            print(f"Generating in one process: extra workers are only used for "
+                  f"{_PARALLEL_MIN_STUDENTS} or more students")
+        elif max_workers and max_workers > 1:
+            try:
+                _, _, _, template_bytes = self._load_template()
+            except Exception:
+                # Let the serial loop report the error for each student
+                template_bytes = None
+        
+        if template_bytes is None:
+            yield from self._generate_batch(jobs)
+            return
+        
+        # A couple of chunks per worker balances the load while still
+        # amortizing each chunk's overlay rendering across many students
+        chunk_size = -(-len(jobs) // (max_workers * 2))
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        
+        # The template and settings are sent once per worker, not with every chunk
+        init_args = (self.positions, self.school_name, self.date,
+                     self.ja_volunteer, self.teacher, template_bytes)
+        reported = 0
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=init_args) as executor:
+                for results in executor.map(_generate_chunk, chunks):
+                    for result in results:
+                        reported += 1
+                        yield result
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Process pool unavailable ({e}); generating the remaining certificates in this process")
+            yield from self._generate_batch(jobs[reported:])
+    
+    def _handle_printing(self, pdf_files: List[str], printer_name: Optional[str] = None,
+                         choose_printer: bool = False):
         """Handle printing of generated certificates."""
         if PrinterManager is None:
             print("Warning: Printing functionality not available (pycups not installed)")
@@ -212,19 +796,19 @@ class CertificateGenerator:
         # Select printer if not specified
         if not printer_name:
             print("\nPrint Options:")
-            printer_name = printer_manager.select_printer()
+            printer_name = printer_manager.select_printer(use_default=not choose_printer)
             
             if not printer_name:
                 print("Printing cancelled")
                 return
-        
-        # Verify printer exists
-        available_printers = printer_manager.get_available_printers()
-        if printer_name not in available_printers:
-            print(f"Error: Printer '{printer_name}' not found!")
-            print("Available printers:")
-            printer_manager.list_printers()
-            return
+        else:
+            # Verify a printer given by name exists; selected printers always do
+            available_printers = printer_manager.get_available_printers()
+            if printer_name not in available_printers:
+                print(f"Error: Printer '{printer_name}' not found!")
+                print("Available printers:")
+                printer_manager.list_printers()
+                return
         
         # Print certificates
         print(f"\nPrinting {len(pdf_files)} certificates...")
@@ -234,6 +818,10 @@ class CertificateGenerator:
     
     def _create_safe_filename(self, student_name):
         """Create a safe filename from student name."""
+        if student_name.isascii():
+            return student_name.translate(_FILENAME_TRANS)
+        
+        # Non-ASCII letters (accents etc.) are kept, as str.isalnum() allows them
         safe_filename = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in student_name)
         return safe_filename.replace(' ', '_')
     
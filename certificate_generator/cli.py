@@ -5,10 +5,33 @@ Command-line interface for the JA Certificate Generator.
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
-from .file_reader import StudentNameExtractor
-from .certificate_generator import CertificateGenerator
+
+# Student names used when no class list is given or none can be read
+_DEFAULT_NAMES = (
+    "Jazmin Badillo Deras",
+    "Maislyn Brinkley",
+    "Nicolas Bustos Henao",
+    "Kinzley Calvin",
+    "Emma Falasca Gobbo",
+    "Tynslee Fishler",
+    "Sebastian Garcia",
+    "Elisa Hernandez Teletor",
+    "Miller Katsetos",
+    "Aiden Kennedy",
+    "Adan Lopez",
+    "Joshua Primero Avila",
+    "Milton Rivera",
+    "Julian Schultz",
+    "Axel Spain",
+    "SaMiyah Turner",
+    "Shehzeen Usman",
+    "Jameson Weeks",
+    "Ryder White",
+    "Ryiana White",
+)
 
 
 def main():
@@ -26,7 +49,9 @@ def main():
                        help='Certificate date (default: 19 November 2025)')
     parser.add_argument('--print', action='store_true', 
                        help='Print certificates after generation')
-    parser.add_argument('--printer', help='Specify printer name (if not provided, will prompt for selection)')
+    parser.add_argument('--printer', help='Specify printer name (if not provided, the default printer is used, or a menu is shown if there is none)')
+    parser.add_argument('--choose-printer', action='store_true', 
+                       help='Choose from the available printers instead of using the default')
     parser.add_argument('--list-printers', action='store_true', 
                        help='List available printers and exit')
     
@@ -43,6 +68,10 @@ def main():
             print("Install with: pip install pycups")
         return
     
+    # Imported here so listing printers does not load ReportLab and PyPDF2
+    from .file_reader import StudentNameExtractor
+    from .certificate_generator import CertificateGenerator
+    
     # Get the project root (parent of the package directory)
     package_dir = Path(__file__).parent
     project_root = package_dir.parent
@@ -118,7 +147,8 @@ def main():
         student_names, 
         str(output_dir),
         print_certificates=args.print,
-        printer_name=args.printer
+        printer_name=args.printer,
+        choose_printer=args.choose_printer
     )
     
     if failed > 0:
@@ -126,30 +156,11 @@ def main():
 
 
 def get_default_names():
-    """Get the default student names list."""
-    return [
-        "Jazmin Badillo Deras",
-        "Maislyn Brinkley", 
-        "Nicolas Bustos Henao",
-        "Kinzley Calvin",
-        "Emma Falasca Gobbo",
-        "Tynslee Fishler",
-        "Sebastian Garcia",
-        "Elisa Hernandez Teletor",
-        "Miller Katsetos",
-        "Aiden Kennedy",
-        "Adan Lopez",
-        "Joshua Primero Avila",
-        "Milton Rivera",
-        "Julian Schultz",
-        "Axel Spain",
-        "SaMiyah Turner",
-        "Shehzeen Usman",
-        "Jameson Weeks",
-        "Ryder White",
-        "Ryiana White"
-    ]
+    """Get the default student names as an immutable sequence."""
+    return _DEFAULT_NAMES
 
 
 if __name__ == "__main__":
+    # Needed for the certificate process pool in frozen executables
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -4,65 +4,78 @@ Multi-format file reader for extracting student names.
 Supports: .docx, .pdf, .csv, .txt, .xlsx, and image files
 """
 
+import logging
 import os
 import re
+import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
-import mimetypes
 
-# File format specific imports
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+# Format specific packages (python-docx, pdfplumber, pandas, openpyxl, Pillow,
+# pytesseract) are optional and imported by the reader that needs them, so
+# reading a .txt or .docx list never pays for loading pandas
 
-try:
-    import pdfplumber
-except ImportError:
-    pdfplumber = None
+logger = logging.getLogger(__name__)
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+# Full names of two or more capitalized parts; allows hyphens, apostrophes,
+# accented letters and mixed case (like SaMiyah)
+_NAME_RE = re.compile(r'^(?:[A-Z][a-zA-ZÀ-ÿ\-\']+)(?:\s+[A-Z][a-zA-ZÀ-ÿ\-\']+)+$')
 
-try:
-    from PIL import Image
-    import pytesseract
-except ImportError:
-    Image = None
-    pytesseract = None
+# Lines containing any of these are headers or labels, not names
+_SKIP_KEYWORDS = frozenset({
+    'student', 'name', 'class', 'grade', 'school', 'teacher',
+    'kindergarten', 'classroom', 'list', '2025', '2026'
+})
+
+# Leading numbers or years
+_HAS_DIGIT_RE = re.compile(r'^\d|\d{4}')
+
+# Spreadsheet column headers containing any of these hold student names
+_NAME_COLUMN_KEYWORDS = ('name', 'student', 'first', 'last')
+
+# Tesseract settings for class lists: LSTM engine, one uniform block of text
+_OCR_CONFIG = '--oem 1 --psm 6'
+
+# Larger scans are downscaled to fit within this size before OCR
+_OCR_MAX_SIZE = (2000, 2000)
+
+# WordprocessingML element tags read by the streaming DOCX reader
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_TEXT = _W_NS + 't'
+_W_TAB = _W_NS + 'tab'
+_W_BREAKS = frozenset({_W_NS + 'br', _W_NS + 'cr'})
+_W_PARAGRAPH = _W_NS + 'p'
 
 class StudentNameExtractor:
     """Extract student names from various file formats."""
     
-    def __init__(self):
-        self.supported_formats = {
-            '.txt': self._read_txt,
-            '.csv': self._read_csv,
-            '.docx': self._read_docx,
-            '.doc': self._read_docx,
-            '.pdf': self._read_pdf,
-            '.xlsx': self._read_excel,
-            '.xls': self._read_excel,
-            '.png': self._read_image,
-            '.jpg': self._read_image,
-            '.jpeg': self._read_image,
-            '.tiff': self._read_image,
-            '.bmp': self._read_image,
-            '.gif': self._read_image
-        }
+    # Extension -> name of the reader method, resolved with getattr on dispatch
+    _FORMAT_HANDLERS = {
+        '.txt': '_read_txt',
+        '.csv': '_read_csv',
+        '.docx': '_read_docx',
+        '.doc': '_read_docx',
+        '.pdf': '_read_pdf',
+        '.xlsx': '_read_excel',
+        '.xls': '_read_excel',
+        '.png': '_read_image',
+        '.jpg': '_read_image',
+        '.jpeg': '_read_image',
+        '.tiff': '_read_image',
+        '.bmp': '_read_image',
+        '.gif': '_read_image'
+    }
     
     def detect_file_type(self, file_path):
-        """Detect file type based on extension and MIME type."""
+        """Detect file type based on extension."""
         file_path = Path(file_path)
         extension = file_path.suffix.lower()
         
-        # Try to determine MIME type as backup
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        
-        print(f"File: {file_path.name}")
-        print(f"Extension: {extension}")
-        print(f"MIME type: {mime_type}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # MIME type is informational only; dispatch uses the extension
+            import mimetypes
+            mime_type, _ = mimetypes.guess_type(str(file_path))
+            logger.debug("File: %s, extension: %s, MIME type: %s", file_path.name, extension, mime_type)
         
         return extension
     
@@ -71,11 +84,12 @@ class StudentNameExtractor:
         try:
             file_type = self.detect_file_type(file_path)
             
-            if file_type not in self.supported_formats:
+            if file_type not in self._FORMAT_HANDLERS:
                 raise ValueError(f"Unsupported file type: {file_type}")
             
             print(f"Processing {file_type} file...")
-            raw_text = self.supported_formats[file_type](file_path)
+            handler = getattr(self, self._FORMAT_HANDLERS[file_type])
+            raw_text = handler(file_path)
             
             if not raw_text:
                 raise ValueError("No text content found in file")
@@ -104,30 +118,27 @@ class StudentNameExtractor:
     
     def _read_csv(self, file_path):
         """Read text from .csv file."""
-        if pd is None:
+        try:
+            import pandas as pd
+        except ImportError:
             # Fallback to basic text reading
             return self._read_txt(file_path)
         
         try:
-            # Try to read CSV with pandas
-            df = pd.read_csv(file_path)
-            
-            # Look for columns that might contain names
-            name_columns = []
-            for col in df.columns:
-                col_lower = col.lower()
-                if any(keyword in col_lower for keyword in ['name', 'student', 'first', 'last']):
-                    name_columns.append(col)
+            # Peek at the header so only the name columns get parsed
+            header = pd.read_csv(file_path, nrows=0).columns
+            name_columns = [col for col in header if self._is_name_column(col)]
             
             if name_columns:
                 # Combine all name columns
+                df = pd.read_csv(file_path, usecols=name_columns, dtype=str)
                 text_content = []
                 for col in name_columns:
-                    text_content.extend(df[col].dropna().astype(str).tolist())
+                    text_content.extend(df[col].dropna().tolist())
                 return '\n'.join(text_content)
             else:
                 # If no obvious name columns, return all text content
-                return df.to_string()
+                return pd.read_csv(file_path).to_string()
                 
         except Exception as e:
             print(f"CSV parsing error: {e}, falling back to text reading")
@@ -135,7 +146,14 @@ class StudentNameExtractor:
     
     def _read_docx(self, file_path):
         """Read text from .docx file."""
-        if Document is None:
+        try:
+            return self._stream_docx_text(file_path)
+        except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+            print(f"DOCX streaming error: {e}, falling back to python-docx")
+        
+        try:
+            from docx import Document
+        except ImportError:
             raise ImportError("python-docx package required for .docx files")
         
         try:
@@ -160,19 +178,64 @@ class StudentNameExtractor:
             print(f"DOCX reading error: {e}")
             return ""
     
-    def _read_pdf(self, file_path):
-        """Read text from .pdf file."""
-        if pdfplumber is None:
+    def _stream_docx_text(self, file_path):
+        """
+        Stream paragraph text out of word/document.xml without building a document model.
+        
+        Paragraphs inside tables are included in document order.
+        """
+        text_content = []
+        runs = []
+        
+        with zipfile.ZipFile(file_path) as archive:
+            with archive.open('word/document.xml') as document_xml:
+                for _, element in ET.iterparse(document_xml, events=('end',)):
+                    tag = element.tag
+                    if tag == _W_TEXT:
+                        if element.text:
+                            runs.append(element.text)
+                    elif tag == _W_TAB:
+                        runs.append('\t')
+                    elif tag in _W_BREAKS:
+                        runs.append('\n')
+                    elif tag == _W_PARAGRAPH:
+                        paragraph = ''.join(runs).strip()
+                        if paragraph:
+                            text_content.append(paragraph)
+                        runs = []
+                        element.clear()
+        
+        return '\n'.join(text_content)
+    
+    def _read_pdf(self, file_path, max_pages=10, early_stop_names=500):
+        """
+        Read text from .pdf file.
+        
+        Class lists are usually on the first page or two, so extraction stops
+        after max_pages pages, or as soon as early_stop_names distinct names
+        have been found.
+        """
+        try:
+            import pdfplumber
+        except ImportError:
             raise ImportError("pdfplumber package required for .pdf files")
         
         try:
             text_content = []
+            found_names = set()
             
             with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
+                for i, page in enumerate(pdf.pages):
+                    if i >= max_pages:
+                        print(f"Stopped reading PDF after {max_pages} pages")
+                        break
+                    
                     text = page.extract_text()
                     if text:
                         text_content.append(text)
+                        found_names.update(name.lower() for name in self._parse_names_from_text(text))
+                        if len(found_names) >= early_stop_names:
+                            break
             
             return '\n'.join(text_content)
             
@@ -182,24 +245,35 @@ class StudentNameExtractor:
     
     def _read_excel(self, file_path):
         """Read text from .xlsx/.xls file."""
-        if pd is None:
+        if Path(file_path).suffix.lower() == '.xlsx':
+            try:
+                import openpyxl
+            except ImportError:
+                openpyxl = None
+            
+            if openpyxl is not None:
+                try:
+                    return self._read_xlsx_read_only(openpyxl, file_path)
+                except Exception as e:
+                    print(f"Excel reading error: {e}")
+                    return ""
+        
+        try:
+            import pandas as pd
+        except ImportError:
             raise ImportError("pandas package required for Excel files")
         
         try:
-            # Read all sheets
+            # Open the workbook once and parse each sheet from it
             excel_file = pd.ExcelFile(file_path)
             text_content = []
             
             for sheet_name in excel_file.sheet_names:
                 print(f"Reading sheet: {sheet_name}")
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
+                df = excel_file.parse(sheet_name)
                 
                 # Look for name columns first
-                name_columns = []
-                for col in df.columns:
-                    col_lower = str(col).lower()
-                    if any(keyword in col_lower for keyword in ['name', 'student', 'first', 'last']):
-                        name_columns.append(col)
+                name_columns = [col for col in df.columns if self._is_name_column(col)]
                 
                 if name_columns:
                     for col in name_columns:
@@ -215,9 +289,49 @@ class StudentNameExtractor:
             print(f"Excel reading error: {e}")
             return ""
     
+    def _read_xlsx_read_only(self, openpyxl, file_path):
+        """Read cell text from .xlsx with openpyxl's streaming read-only mode."""
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        text_content = []
+        
+        try:
+            for sheet in workbook.worksheets:
+                print(f"Reading sheet: {sheet.title}")
+                rows = sheet.iter_rows(values_only=True)
+                header = next(rows, None)
+                if header is None:
+                    continue
+                
+                # Blank headers get pandas-style "Unnamed: N" labels
+                labels = [f"Unnamed: {i}" if col is None else col for i, col in enumerate(header)]
+                name_indexes = [i for i, col in enumerate(labels) if self._is_name_column(col)]
+                indexes = name_indexes or list(range(len(labels)))
+                
+                # Collect column by column, matching the pandas reader's order
+                columns = {i: [] for i in indexes}
+                for row in rows:
+                    for i in indexes:
+                        if i < len(row) and row[i] is not None:
+                            columns[i].append(str(row[i]))
+                
+                for i in indexes:
+                    text_content.extend(columns[i])
+        finally:
+            workbook.close()
+        
+        return '\n'.join(text_content)
+    
+    def _is_name_column(self, column):
+        """Check whether a spreadsheet column header looks like it holds names."""
+        col_lower = str(column).lower()
+        return any(keyword in col_lower for keyword in _NAME_COLUMN_KEYWORDS)
+    
     def _read_image(self, file_path):
         """Read text from image using OCR."""
-        if Image is None or pytesseract is None:
+        try:
+            from PIL import Image
+            import pytesseract
+        except ImportError:
             raise ImportError("Pillow and pytesseract packages required for image files")
         
         try:
@@ -230,12 +344,15 @@ class StudentNameExtractor:
             
             image = Image.open(file_path)
             
-            # Convert to RGB if necessary
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
+            # Tesseract binarizes internally, so hand it grayscale directly
+            if image.mode != 'L':
+                image = image.convert('L')
+            
+            # OCR time grows with pixel count; name lists stay legible when downscaled
+            image.thumbnail(_OCR_MAX_SIZE, Image.LANCZOS)
             
-            # Perform OCR
-            text = pytesseract.image_to_string(image)
+            # Perform OCR, treating the image as a single block of text
+            text = pytesseract.image_to_string(image, config=_OCR_CONFIG)
             return text
             
         except Exception as e:
@@ -247,18 +364,6 @@ class StudentNameExtractor:
         names = []
         lines = text.split('\n')
         
-        # Patterns that typically indicate names
-        name_patterns = [
-            # Full names (First Last, First Middle Last, etc.)
-            r'^[A-Z][a-z]+ [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*$',
-            # Names with special characters (hyphens, apostrophes)
-            r'^[A-Z][a-z\-\']+\s+[A-Z][a-z\-\']+(?:\s+[A-Z][a-z\-\']+)*$',
-            # Names with accented characters
-            r'^[A-Z][a-zÀ-ÿ\-\']+\s+[A-Z][a-zÀ-ÿ\-\']+(?:\s+[A-Z][a-zÀ-ÿ\-\']+)*$',
-            # Names with mixed case (like SaMiyah)
-            r'^[A-Z][a-zA-Z\-\']+\s+[A-Z][a-zA-Z\-\']+(?:\s+[A-Z][a-zA-Z\-\']+)*$'
-        ]
-        
         for line in lines:
             line = line.strip()
             
@@ -267,38 +372,31 @@ class StudentNameExtractor:
                 continue
             
             # Skip lines that look like headers or labels
-            if any(keyword in line.lower() for keyword in [
-                'student', 'name', 'class', 'grade', 'school', 'teacher',
-                'kindergarten', 'classroom', 'list', '2025', '2026'
-            ]):
+            low = line.lower()
+            if any(keyword in low for keyword in _SKIP_KEYWORDS):
                 continue
             
             # Skip lines with numbers (unless they're part of a name)
-            if re.search(r'^\d+', line) or re.search(r'\d{4}', line):
+            if _HAS_DIGIT_RE.search(line):
                 continue
             
-            # Check if line matches name patterns
-            for pattern in name_patterns:
-                if re.match(pattern, line):
-                    # Additional validation: must have at least first and last name
-                    parts = line.split()
-                    if len(parts) >= 2 and all(len(part) >= 2 for part in parts):
-                        names.append(line)
-                        break
+            # Check if line matches the name pattern
+            if _NAME_RE.match(line):
+                # Additional validation: must have at least first and last name
+                parts = line.split()
+                if len(parts) >= 2 and all(len(part) >= 2 for part in parts):
+                    names.append(line)
         
-        # Remove duplicates while preserving order
-        unique_names = []
-        seen = set()
+        # Remove case-insensitive duplicates, keeping the first spelling seen
+        unique_names = {}
         for name in names:
-            if name.lower() not in seen:
-                unique_names.append(name)
-                seen.add(name.lower())
+            unique_names.setdefault(name.lower(), name)
         
-        return unique_names
+        return list(unique_names.values())
     
     def list_supported_formats(self):
         """List all supported file formats."""
-        return list(self.supported_formats.keys())
+        return list(self._FORMAT_HANDLERS.keys())
 
 def main():
     """Test the extractor with various file types."""
@@ -5,24 +5,22 @@ Supports printer selection and print job management.
 """
 
 import os
+import re
 import sys
 import subprocess
 from pathlib import Path
-from typing import List, Optional, Dict, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    # Type checking imports - only for static analysis
-    try:
-        import cups  # pyright: ignore[reportMissingImports]
-    except ImportError:
-        pass
+from typing import List, Optional, Dict
 
 try:
-    import cups  # pyright: ignore[reportMissingImports]
-    CUPS_AVAILABLE = True
+    import cups
 except ImportError:
-    CUPS_AVAILABLE = False
-    cups = None  # Define cups as None when not available
+    cups = None  # Printing falls back to system commands without pycups
+
+CUPS_AVAILABLE = cups is not None
+
+
+# Printer lines in `lpstat -p` output, capturing the queue name
+_PRINTER_RE = re.compile(r'^printer\s+(\S+)')
 
 
 class PrinterManager:
@@ -31,15 +29,44 @@ class PrinterManager:
     def __init__(self):
         """Initialize printer manager."""
         self.conn = None
-        if CUPS_AVAILABLE and cups is not None:
+        if cups is not None:
             try:
                 self.conn = cups.Connection()
             except Exception as e:
                 print(f"Warning: Could not connect to CUPS: {e}")
                 self.conn = None
+        
+        # Printer list and default printer, fetched on first use and kept
+        # until refresh_printers() is called
+        self._printers_cache: Optional[Dict[str, Dict]] = None
+        self._default_printer: Optional[str] = None
+        self._default_printer_known = False
+    
+    def refresh_printers(self) -> None:
+        """Forget the cached printers so the next lookup asks CUPS again."""
+        self._printers_cache = None
+        self._default_printer = None
+        self._default_printer_known = False
     
     def get_available_printers(self) -> Dict[str, Dict]:
         """Get list of available printers."""
+        if self._printers_cache is None:
+            self._printers_cache = self._fetch_printers()
+        return self._printers_cache
+    
+    def get_default_printer(self) -> Optional[str]:
+        """Get the name of the CUPS default printer, if one is set."""
+        if not self._default_printer_known:
+            if self.conn:
+                try:
+                    self._default_printer = self.conn.getDefault()
+                except Exception as e:
+                    print(f"Error getting default printer via CUPS: {e}")
+            self._default_printer_known = True
+        return self._default_printer
+    
+    def _fetch_printers(self) -> Dict[str, Dict]:
+        """Query CUPS, or the system commands, for the available printers."""
         printers = {}
         
         if self.conn:
@@ -63,18 +90,17 @@ class PrinterManager:
             result = subprocess.run(['lpstat', '-p'], 
                                   capture_output=True, text=True, timeout=10)
             if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.startswith('printer'):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            printer_name = parts[1]
-                            status = 'idle' if 'idle' in line else 'unknown'
-                            printers[printer_name] = {
-                                'device-uri': 'unknown',
-                                'printer-info': printer_name,
-                                'printer-state': status,
-                                'printer-state-message': line
-                            }
+                for line in result.stdout.splitlines():
+                    match = _PRINTER_RE.match(line)
+                    if match:
+                        printer_name = match.group(1)
+                        status = 'idle' if 'idle' in line else 'unknown'
+                        printers[printer_name] = {
+                            'device-uri': 'unknown',
+                            'printer-info': printer_name,
+                            'printer-state': status,
+                            'printer-state-message': line
+                        }
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
             # Try lpoptions command
             try:
@@ -117,8 +143,19 @@ class PrinterManager:
             print(f"   Status: {status}")
             print()
     
-    def select_printer(self) -> Optional[str]:
-        """Interactive printer selection."""
+    def select_printer(self, use_default: bool = True) -> Optional[str]:
+        """
+        Interactive printer selection.
+        
+        When use_default is set and CUPS has a default printer, that printer
+        is used without listing the others or prompting.
+        """
+        if use_default:
+            default_printer = self.get_default_printer()
+            if default_printer:
+                print(f"Using default printer: {default_printer}")
+                return default_printer
+        
         printers = self.get_available_printers()
         
         if not printers:
@@ -162,10 +199,6 @@ class PrinterManager:
     
     def print_pdf(self, pdf_path: str, printer_name: str, job_name: Optional[str] = None) -> bool:
         """Print a PDF file to the specified printer."""
-        if not os.path.exists(pdf_path):
-            print(f"Error: File {pdf_path} not found!")
-            return False
-        
         if not job_name:
             job_name = f"Certificate - {Path(pdf_path).stem}"
         
@@ -197,20 +230,59 @@ class PrinterManager:
         
         return success
     
+    def _print_pdfs_lpr_batch(self, printer_name: str, pdf_paths: List[str]) -> bool:
+        """Print several PDF files with one lpr command."""
+        try:
+            cmd = ['lpr', '-P', printer_name, *pdf_paths]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            
+            if result.returncode == 0:
+                print(f"Print job with {len(pdf_paths)} certificates sent to {printer_name} successfully")
+                return True
+            print(f"Batch print command failed: {result.stderr}")
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError) as e:
+            print(f"System batch print command failed: {e}")
+        return False
+    
     def print_multiple_pdfs(self, pdf_paths: List[str], printer_name: str) -> Dict[str, bool]:
         """Print multiple PDF files to the specified printer."""
         results = {}
         
         print(f"\nPrinting {len(pdf_paths)} certificates to {printer_name}...")
         
-        for i, pdf_path in enumerate(pdf_paths, 1):
-            print(f"Printing {i}/{len(pdf_paths)}: {Path(pdf_path).name}")
-            
-            success = self.print_pdf(pdf_path, printer_name)
-            results[pdf_path] = success
-            
-            if not success:
-                print(f"Failed to print: {pdf_path}")
+        # Check every file once up front instead of before each submission
+        for pdf_path in pdf_paths:
+            if not os.path.exists(pdf_path):
+                print(f"Error: File {pdf_path} not found!")
+                results[pdf_path] = False
+        to_print = [pdf_path for pdf_path in pdf_paths if pdf_path not in results]
+        submitted = False
+        
+        # Submit every certificate as one CUPS job
+        if self.conn and to_print:
+            try:
+                job_id = self.conn.printFiles(printer_name, to_print, "Certificates batch", {})
+                print(f"Print job {job_id} with {len(to_print)} certificates sent to {printer_name}")
+                submitted = True
+            except Exception as e:
+                print(f"CUPS batch printing failed: {e}")
+        
+        # Without CUPS, hand every certificate to a single lpr command
+        if self.conn is None and to_print:
+            submitted = self._print_pdfs_lpr_batch(printer_name, to_print)
+        
+        if submitted:
+            results.update((pdf_path, True) for pdf_path in to_print)
+        else:
+            # Fall back to sending the files one at a time
+            for i, pdf_path in enumerate(to_print, 1):
+                print(f"Printing {i}/{len(to_print)}: {Path(pdf_path).name}")
+                
+                success = self.print_pdf(pdf_path, printer_name)
+                results[pdf_path] = success
+                
+                if not success:
+                    print(f"Failed to print: {pdf_path}")
         
         # Summary
         successful = sum(1 for success in results.values() if success)
@@ -243,14 +315,16 @@ def main():
         # Look for sample PDFs to print
         sample_pdf_dir = Path("output/certificates")
         if sample_pdf_dir.exists():
-            pdf_files = list(sample_pdf_dir.glob("*.pdf"))
+            with os.scandir(sample_pdf_dir) as entries:
+                pdf_files = [entry.path for entry in entries
+                             if entry.name.endswith('.pdf') and entry.is_file(follow_symlinks=False)]
             if pdf_files:
                 print(f"\nFound {len(pdf_files)} certificate files")
                 
                 # Ask if user wants to print them
                 response = input("Print all certificates? (y/n): ").strip().lower()
                 if response == 'y':
-                    printer_manager.print_multiple_pdfs([str(f) for f in pdf_files], selected_printer)
+                    printer_manager.print_multiple_pdfs(pdf_files, selected_printer)
                 else:
                     print("Print cancelled")
             else:
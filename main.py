@@ -6,13 +6,37 @@ Generates personalized certificates from various input file formats.
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from certificate_generator import StudentNameExtractor, CertificateGenerator
+
+# Student names used when no class list is given or none can be read
+_DEFAULT_NAMES = (
+    "Jazmin Badillo Deras",
+    "Maislyn Brinkley",
+    "Nicolas Bustos Henao",
+    "Kinzley Calvin",
+    "Emma Falasca Gobbo",
+    "Tynslee Fishler",
+    "Sebastian Garcia",
+    "Elisa Hernandez Teletor",
+    "Miller Katsetos",
+    "Aiden Kennedy",
+    "Adan Lopez",
+    "Joshua Primero Avila",
+    "Milton Rivera",
+    "Julian Schultz",
+    "Axel Spain",
+    "SaMiyah Turner",
+    "Shehzeen Usman",
+    "Jameson Weeks",
+    "Ryder White",
+    "Ryiana White",
+)
 
 
 def main():
@@ -21,7 +45,7 @@ def main():
     
     # Set up command line argument parsing
     parser = argparse.ArgumentParser(description='Generate JA certificates from student lists')
-    parser.add_argument('input_file', nargs='?', help='Path to student list file')
+    parser.add_argument('input_file', nargs='?', type=Path, help='Path to student list file')
     parser.add_argument('--ja-volunteer', help='JA Volunteer name (optional)')
     parser.add_argument('--teacher', help='Teacher name (optional)')
     parser.add_argument('--school', default="Andrew Jackson Elementary School", 
@@ -30,11 +54,15 @@ def main():
                        help='Certificate date (default: 19 November 2025)')
     parser.add_argument('--print', action='store_true', 
                        help='Print certificates after generation')
-    parser.add_argument('--printer', help='Specify printer name (if not provided, will prompt for selection)')
-    parser.add_argument('--output-dir', default="certificates", 
+    parser.add_argument('--printer', help='Specify printer name (if not provided, the default printer is used, or a menu is shown if there is none)')
+    parser.add_argument('--choose-printer', action='store_true', 
+                       help='Choose from the available printers instead of using the default')
+    parser.add_argument('--output-dir', type=Path, default="certificates", 
                        help='Output directory for certificates (default: certificates in current directory)')
     parser.add_argument('--list-printers', action='store_true', 
                        help='List available printers and exit')
+    parser.add_argument('--workers', type=int, 
+                       help='Number of processes used for classes of 1000 or more students (default: generate in one process)')
     
     args = parser.parse_args()
     
@@ -49,12 +77,15 @@ def main():
             print("Install with: pip install pycups")
         return
     
+    # Imported here so listing printers does not load ReportLab and PyPDF2
+    from certificate_generator import StudentNameExtractor, CertificateGenerator
+    
     # Default paths (relative to project root)
     template_path = project_root / "data" / "E004 Certificate of Achievement.pdf"
     
     # Set output directory - handle both absolute and relative paths
     if os.path.isabs(args.output_dir):
-        output_dir = Path(args.output_dir)
+        output_dir = args.output_dir
     else:
         # For relative paths, use current working directory (not project root)
         output_dir = Path.cwd() / args.output_dir
@@ -66,7 +97,7 @@ def main():
             # Make relative paths relative to project root
             input_file = project_root / args.input_file
         else:
-            input_file = Path(args.input_file)
+            input_file = args.input_file
             
         if not input_file.exists():
             print(f"Error: File '{input_file}' not found!")
@@ -82,10 +113,16 @@ def main():
             "class_list.xlsx"
         ]
         
+        # List the data directory once, then take the first candidate present
+        try:
+            with os.scandir(data_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
+        
         for file_name in possible_files:
-            test_path = data_dir / file_name
-            if test_path.exists():
-                input_file = test_path
+            if file_name in present:
+                input_file = data_dir / file_name
                 break
     
     # Get student names
@@ -112,8 +149,12 @@ def main():
         print(f"Error: Template file not found: {template_path}")
         sys.exit(1)
     
+    # Read the template once; the generator and its workers parse it from memory
+    template_bytes = template_path.read_bytes()
+    
     generator = CertificateGenerator(
         template_path=str(template_path),
+        template_bytes=template_bytes,
         school_name=args.school,
         date=args.date,
         ja_volunteer=args.ja_volunteer,
@@ -125,7 +166,9 @@ def main():
         student_names, 
         str(output_dir),
         print_certificates=args.print,
-        printer_name=args.printer
+        printer_name=args.printer,
+        choose_printer=args.choose_printer,
+        max_workers=args.workers
     )
     
     if failed > 0:
@@ -133,30 +176,11 @@ def main():
 
 
 def get_default_names():
-    """Get the default student names list."""
-    return [
-        "Jazmin Badillo Deras",
-        "Maislyn Brinkley", 
-        "Nicolas Bustos Henao",
-        "Kinzley Calvin",
-        "Emma Falasca Gobbo",
-        "Tynslee Fishler",
-        "Sebastian Garcia",
-        "Elisa Hernandez Teletor",
-        "Miller Katsetos",
-        "Aiden Kennedy",
-        "Adan Lopez",
-        "Joshua Primero Avila",
-        "Milton Rivera",
-        "Julian Schultz",
-        "Axel Spain",
-        "SaMiyah Turner",
-        "Shehzeen Usman",
-        "Jameson Weeks",
-        "Ryder White",
-        "Ryiana White"
-    ]
+    """Get the default student names as an immutable sequence."""
+    return _DEFAULT_NAMES
 
 
 if __name__ == "__main__":
+    # Needed for the certificate process pool in frozen executables
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -3,13 +3,22 @@
 Script to analyze the certificate PDF and find exact positioning for text fields.
 """
 
-from PyPDF2 import PdfReader
-from reportlab.pdfgen import canvas
-from reportlab.lib.colors import red, blue, green
+import functools
+import sys
+from pathlib import Path
+
+from PyPDF2 import PdfReader, PdfWriter
 import io
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 def create_positioning_guide(page_width, page_height):
     """Create a PDF overlay with positioning guides to help identify correct coordinates."""
+    # ReportLab is only loaded once there is an overlay to draw
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.colors import red, blue
+    
     packet = io.BytesIO()
     can = canvas.Canvas(packet, pagesize=(page_width, page_height))
     
@@ -17,14 +26,14 @@ def create_positioning_guide(page_width, page_height):
     can.setStrokeColor(red)
     can.setLineWidth(0.5)
     
-    # Vertical lines every 50 points
-    for x in range(0, int(page_width), 50):
-        can.line(x, 0, x, page_height)
-        can.drawString(x, 10, str(x))
+    # Vertical and horizontal lines every 50 points, stroked as one path
+    xs = range(0, int(page_width), 50)
+    ys = range(0, int(page_height), 50)
+    can.lines([(x, 0, x, page_height) for x in xs] + [(0, y, page_width, y) for y in ys])
     
-    # Horizontal lines every 50 points
-    for y in range(0, int(page_height), 50):
-        can.line(0, y, page_width, y)
+    for x in xs:
+        can.drawString(x, 10, str(x))
+    for y in ys:
         can.drawString(10, y, str(y))
     
     # Mark common certificate positions based on standard JA layouts
@@ -51,6 +60,11 @@ def create_positioning_guide(page_width, page_height):
     packet.seek(0)
     return packet
 
+@functools.lru_cache(maxsize=4)
+def _positioning_guide_bytes(page_width, page_height):
+    """Positioning guide PDF bytes for a page size, rendered once per size."""
+    return create_positioning_guide(page_width, page_height).getvalue()
+
 def analyze_certificate():
     """Analyze the certificate template and create a positioning guide."""
     template_path = "E004 Certificate of Achievement.pdf"
@@ -70,18 +84,16 @@ def analyze_certificate():
         print(text)
         
         # Create positioning guide
-        guide_packet = create_positioning_guide(page_width, page_height)
-        guide_reader = PdfReader(guide_packet)
+        guide_reader = PdfReader(io.BytesIO(_positioning_guide_bytes(page_width, page_height)))
         guide_page = guide_reader.pages[0]
         
-        # Merge with template
-        template_page.merge_page(guide_page)
-        
-        # Save analysis file
-        from PyPDF2 import PdfWriter
+        # Stamp the guide onto a copy of the template page
         writer = PdfWriter()
-        writer.add_page(template_page)
+        page = writer.add_page(template_page)
+        from certificate_generator.certificate_generator import stamp_overlay
+        stamp_overlay(writer, page, guide_page)
         
+        # Save analysis file
         with open("certificate_analysis.pdf", 'wb') as output_file:
             writer.write(output_file)
             
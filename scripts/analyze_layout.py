@@ -3,19 +3,28 @@
 Script to analyze the certificate template and help determine proper text positioning.
 """
 
+import functools
+import sys
+from pathlib import Path
+
 from PyPDF2 import PdfReader
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.colors import red, blue, green
 import io
 
-def analyze_certificate_layout():
-    """Analyze the certificate template and create a grid overlay to help with positioning."""
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+def analyze_certificate_layout(reader=None):
+    """
+    Analyze the certificate template and create a grid overlay to help with positioning.
+    
+    Pass an already-open reader to reuse it instead of parsing the template again.
+    """
     template_path = "E004 Certificate of Achievement.pdf"
     
     try:
         # Read the template PDF
-        reader = PdfReader(template_path)
+        if reader is None:
+            reader = PdfReader(template_path)
         template_page = reader.pages[0]
         page_width = float(template_page.mediabox.width)
         page_height = float(template_page.mediabox.height)
@@ -61,56 +70,75 @@ def analyze_certificate_layout():
         print(f"Error analyzing certificate: {str(e)}")
         return None
 
-def create_test_certificate():
-    """Create a test certificate with grid lines to help visualize positioning."""
-    coords = analyze_certificate_layout()
-    if not coords:
-        return
+@functools.lru_cache(maxsize=4)
+def _make_overlay(page_width, page_height, text_positions):
+    """
+    Render the grid and test text overlay, reusing the bytes for repeat layouts.
     
-    from PyPDF2 import PdfWriter
+    text_positions holds the (x, y) of the student name, school name and date.
+    """
+    # ReportLab is only loaded once there is an overlay to draw
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.colors import red, blue
     
-    # Read template
-    reader = PdfReader("E004 Certificate of Achievement.pdf")
-    writer = PdfWriter()
-    template_page = reader.pages[0]
+    (student_name_x, student_name_y), (school_name_x, school_name_y), (date_x, date_y) = text_positions
     
-    # Create overlay with grid and test text
     packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=(coords['page_width'], coords['page_height']))
+    can = canvas.Canvas(packet, pagesize=(page_width, page_height))
     
     # Draw grid lines for reference (in light colors)
     can.setStrokeColor(red)
     can.setLineWidth(0.5)
     
-    # Vertical grid lines every 10%
-    for i in range(1, 10):
-        x = coords['page_width'] * i / 10
-        can.line(x, 0, x, coords['page_height'])
-    
-    # Horizontal grid lines every 10%
-    for i in range(1, 10):
-        y = coords['page_height'] * i / 10
-        can.line(0, y, coords['page_width'], y)
+    # Vertical and horizontal grid lines every 10%, stroked as one path
+    can.lines([(page_width * i / 10, 0, page_width * i / 10, page_height) for i in range(1, 10)] +
+              [(0, page_height * i / 10, page_width, page_height * i / 10) for i in range(1, 10)])
     
     # Test text positioning
     can.setFillColor(blue)
     can.setFont("Helvetica-Bold", 18)
-    can.drawString(coords['student_name_x'], coords['student_name_y'], "TEST STUDENT NAME")
+    can.drawString(student_name_x, student_name_y, "TEST STUDENT NAME")
     
     can.setFont("Helvetica", 14)
-    can.drawString(coords['school_name_x'], coords['school_name_y'], "Andrew Jackson Elementary School")
+    can.drawString(school_name_x, school_name_y, "Andrew Jackson Elementary School")
     
     can.setFont("Helvetica", 12)
-    can.drawString(coords['date_x'], coords['date_y'], "19 November 2025")
+    can.drawString(date_x, date_y, "19 November 2025")
     
     can.save()
-    packet.seek(0)
+    return packet.getvalue()
+
+def create_test_certificate():
+    """Create a test certificate with grid lines to help visualize positioning."""
+    from PyPDF2 import PdfWriter
+    
+    # Read the template once and share it with the layout analysis
+    try:
+        reader = PdfReader("E004 Certificate of Achievement.pdf")
+    except Exception as e:
+        print(f"Error analyzing certificate: {str(e)}")
+        return
+    
+    coords = analyze_certificate_layout(reader)
+    if not coords:
+        return
+    
+    writer = PdfWriter()
+    template_page = reader.pages[0]
+    
+    # Create overlay with grid and test text
+    overlay_bytes = _make_overlay(coords['page_width'], coords['page_height'], (
+        (coords['student_name_x'], coords['student_name_y']),
+        (coords['school_name_x'], coords['school_name_y']),
+        (coords['date_x'], coords['date_y']),
+    ))
     
-    # Merge with template
-    overlay_reader = PdfReader(packet)
+    # Stamp the overlay onto a copy of the template page
+    overlay_reader = PdfReader(io.BytesIO(overlay_bytes))
     overlay_page = overlay_reader.pages[0]
-    template_page.merge_page(overlay_page)
-    writer.add_page(template_page)
+    page = writer.add_page(template_page)
+    from certificate_generator.certificate_generator import stamp_overlay
+    stamp_overlay(writer, page, overlay_page)
     
     # Save test certificate
     with open("test_certificate_positioning.pdf", 'wb') as output_file:
@@ -4,13 +4,22 @@ Script to create a coordinate mapping overlay on the certificate.
 This will help identify the exact positions for text placement.
 """
 
+import functools
+import sys
+from pathlib import Path
+
 from PyPDF2 import PdfReader, PdfWriter
-from reportlab.pdfgen import canvas
-from reportlab.lib.colors import red, blue, green, black
 import io
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 def create_coordinate_overlay(page_width, page_height):
     """Create a PDF overlay with coordinate grid and markers."""
+    # ReportLab is only loaded once there is an overlay to draw
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.colors import red, blue, green, black
+    
     packet = io.BytesIO()
     can = canvas.Canvas(packet, pagesize=(page_width, page_height))
     
@@ -21,21 +30,23 @@ def create_coordinate_overlay(page_width, page_height):
     # Draw grid lines every 50 points
     can.setLineWidth(0.5)
     
-    # Vertical lines
-    for x in range(0, int(page_width), 50):
-        can.line(x, 0, x, page_height)
-        # Add coordinate labels
-        if x % 100 == 0:  # Every 100 points
-            can.setFont("Helvetica", 8)
-            can.drawString(x + 2, page_height - 20, str(x))
-    
-    # Horizontal lines
-    for y in range(0, int(page_height), 50):
-        can.line(0, y, page_width, y)
-        # Add coordinate labels
-        if y % 100 == 0:  # Every 100 points
-            can.setFont("Helvetica", 8)
-            can.drawString(5, y + 2, str(y))
+    # Vertical and horizontal lines, stroked as one path
+    xs = range(0, int(page_width), 50)
+    ys = range(0, int(page_height), 50)
+    can.lines([(x, 0, x, page_height) for x in xs] + [(0, y, page_width, y) for y in ys])
+    
+    # Canvas methods used inside the loops below
+    draw_string = can.drawString
+    set_fill_color = can.setFillColor
+    circle = can.circle
+    
+    # Add coordinate labels every 100 points
+    can.setFont("Helvetica", 8)
+    label_y = page_height - 20
+    for x in xs[::2]:
+        draw_string(x + 2, label_y, str(x))
+    for y in ys[::2]:
+        draw_string(5, y + 2, str(y))
     
     # Add center lines in different color
     can.setStrokeColor(blue)
@@ -93,13 +104,14 @@ def create_coordinate_overlay(page_width, page_height):
         (center_x, 100, "Y=100"),
     ]
     
+    string_width = can.stringWidth
     for x, y, label in reference_positions:
-        text_width = can.stringWidth(label, "Helvetica", 12)
-        can.drawString(x - text_width/2, y, label)
+        text_width = string_width(label, "Helvetica", 12)
+        draw_string(x - text_width/2, y, label)
         # Add a small marker
-        can.setFillColor(red)
-        can.circle(x, y - 5, 2, fill=1)
-        can.setFillColor(black)
+        set_fill_color(red)
+        circle(x, y - 5, 2, fill=1)
+        set_fill_color(black)
     
     # Add title
     can.setFont("Helvetica-Bold", 16)
@@ -112,6 +124,11 @@ def create_coordinate_overlay(page_width, page_height):
     packet.seek(0)
     return packet
 
+@functools.lru_cache(maxsize=4)
+def _coordinate_overlay_bytes(page_width, page_height):
+    """Coordinate overlay PDF bytes, cached by page size."""
+    return create_coordinate_overlay(page_width, page_height).getvalue()
+
 def create_coordinate_mapped_certificate():
     """Create a certificate with coordinate overlay."""
     template_path = "E004 Certificate of Achievement.pdf"
@@ -131,13 +148,13 @@ def create_coordinate_mapped_certificate():
         print(f"Certificate dimensions in inches: {page_width/72:.2f} x {page_height/72:.2f}")
         
         # Create coordinate overlay
-        overlay_packet = create_coordinate_overlay(page_width, page_height)
-        overlay_reader = PdfReader(overlay_packet)
+        overlay_reader = PdfReader(io.BytesIO(_coordinate_overlay_bytes(page_width, page_height)))
         overlay_page = overlay_reader.pages[0]
         
-        # Merge the overlay with the template
-        template_page.merge_page(overlay_page)
-        writer.add_page(template_page)
+        # Stamp the overlay onto a copy of the template page
+        page = writer.add_page(template_page)
+        from certificate_generator.certificate_generator import stamp_overlay
+        stamp_overlay(writer, page, overlay_page)
         
         # Write the output PDF
         with open(output_path, 'wb') as output_file:
@@ -6,44 +6,52 @@ Test script to generate a single certificate with new positioning.
 from PyPDF2 import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import black
+from pathlib import Path
+import functools
 import io
+import sys
 import os
 
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from certificate_generator.certificate_generator import stamp_overlay
+
+@functools.lru_cache(maxsize=None)
+def _get_template(template_path):
+    """Read and parse a template PDF once, returning (reader, page_width, page_height)."""
+    reader = PdfReader(template_path)
+    mediabox = reader.pages[0].mediabox
+    return reader, float(mediabox.width), float(mediabox.height)
+
+def _draw_fields(can, fields):
+    """Draw (text, (font, size), x, y) fields, calling setFont only when the font changes."""
+    can.setFillColor(black)
+    current_font = None
+    for text, font, x, y in fields:
+        if font != current_font:
+            can.setFont(*font)
+            current_font = font
+        can.drawString(x, y, text)
+
 def create_text_overlay(student_name, school_name, date, page_width, page_height):
     """Create a PDF overlay with the student information."""
     packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=(page_width, page_height))
+    # Left uncompressed: the overlay is decoded again when it is stamped
+    can = canvas.Canvas(packet, pagesize=(page_width, page_height), pageCompression=0)
     
     # Based on JA Certificate E004 layout analysis
     # Certificate dimensions: 792 x 612 points (11" x 8.5")
-    
-    # Student name positioning - appears on the main line in the certificate
-    # Position based on the actual blank line location in the certificate
-    can.setFont("Helvetica-Bold", 20)  # Slightly smaller for better fit
-    can.setFillColor(black)
-    
-    # Student name - positioned to align with the blank line on the certificate
-    # From analysis: the student name line is approximately 60% from bottom
-    student_name_x = 240  # Left-aligned to match certificate design
-    student_name_y = 368  # Adjusted to align with the actual line
-    
-    can.drawString(student_name_x, student_name_y, student_name)
-    
-    # School name positioning
-    # The school name appears below the main text, usually around 35-40% from bottom
-    can.setFont("Helvetica", 14)
-    school_name_x = 240  # Left-aligned to match certificate layout
-    school_name_y = 225  # Adjusted to align with school name line
-    
-    can.drawString(school_name_x, school_name_y, school_name)
-    
-    # Date positioning  
-    # Date typically appears in the bottom section, around 20-25% from bottom
-    can.setFont("Helvetica", 12)
-    date_x = 590  # Positioned towards the right side for date field
-    date_y = 135   # Adjusted to align with date line
-    
-    can.drawString(date_x, date_y, date)
+    _draw_fields(can, (
+        # Student name - positioned to align with the blank line on the certificate
+        # From analysis: the student name line is approximately 60% from bottom
+        # (left-aligned to match certificate design, slightly smaller for better fit)
+        (student_name, ("Helvetica-Bold", 20), 240, 368),
+        # School name - appears below the main text, around 35-40% from bottom
+        (school_name, ("Helvetica", 14), 240, 225),
+        # Date - bottom section towards the right side, around 20-25% from bottom
+        (date, ("Helvetica", 12), 590, 135),
+    ))
     
     can.save()
     packet.seek(0)
@@ -58,26 +66,24 @@ def generate_test_certificate():
     output_path = "test_improved_certificate.pdf"
     
     try:
-        # Read the template PDF
-        reader = PdfReader(template_path)
-        writer = PdfWriter()
+        # Read the template PDF (parsed once and reused on later calls)
+        reader, page_width, page_height = _get_template(template_path)
         
         # Get the first page
         template_page = reader.pages[0]
-        page_width = float(template_page.mediabox.width)
-        page_height = float(template_page.mediabox.height)
         
         # Create text overlay
         overlay_packet = create_text_overlay(student_name, school_name, date, page_width, page_height)
         overlay_reader = PdfReader(overlay_packet)
         overlay_page = overlay_reader.pages[0]
         
-        # Merge the overlay with the template
-        template_page.merge_page(overlay_page)
-        writer.add_page(template_page)
-        
-        # Write the output PDF
+        # Write the output PDF straight into the open file
         with open(output_path, 'wb') as output_file:
+            writer = PdfWriter()
+            
+            # Stamp the overlay onto the writer's copy of the template page
+            page = writer.add_page(template_page)
+            stamp_overlay(writer, page, overlay_page)
             writer.write(output_file)
             
         print(f"Generated test certificate: {output_path}")
@@ -6,12 +6,47 @@ Test script to generate a single certificate for positioning verification.
 from PyPDF2 import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import black
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from pathlib import Path
+import functools
 import io
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from certificate_generator.certificate_generator import stamp_overlay
+
+@functools.lru_cache(maxsize=None)
+def _get_template(template_path):
+    """Read and parse a template PDF once, returning (reader, page_width, page_height)."""
+    reader = PdfReader(template_path)
+    mediabox = reader.pages[0].mediabox
+    return reader, float(mediabox.width), float(mediabox.height)
+
+# Per-character widths at 1000 points for each font, seeded with printable
+# ASCII for the fonts used below; other characters are added on first use
+_CHAR_WIDTHS = {
+    font_name: {chr(code): stringWidth(chr(code), font_name, 1000) for code in range(32, 127)}
+    for font_name in ("Helvetica-Bold", "Helvetica")
+}
+
+def _text_width(text, font_name, font_size):
+    """Return the width of text in points, summed from the cached character widths."""
+    widths = _CHAR_WIDTHS.setdefault(font_name, {})
+    total = 0
+    for char in text:
+        width = widths.get(char)
+        if width is None:
+            width = widths[char] = stringWidth(char, font_name, 1000)
+        total += width
+    return total * font_size / 1000
 
 def create_text_overlay(student_name, school_name, date, page_width, page_height):
     """Create a PDF overlay with the student information."""
     packet = io.BytesIO()
-    can = canvas.Canvas(packet, pagesize=(page_width, page_height))
+    # Left uncompressed: the overlay is decoded again when it is stamped
+    can = canvas.Canvas(packet, pagesize=(page_width, page_height), pageCompression=0)
     
     # Based on JA Certificate E004 layout analysis:
     # Certificate dimensions: 792 x 612 (11" x 8.5" landscape)
@@ -25,7 +60,7 @@ def create_text_overlay(student_name, school_name, date, page_width, page_height
     student_name_y = 380  # Position above the "Student Name" line
     
     # Draw student name centered
-    text_width = can.stringWidth(student_name, "Helvetica-Bold", 20)
+    text_width = _text_width(student_name, "Helvetica-Bold", 20)
     can.drawString(student_name_x - text_width/2, student_name_y, student_name)
     
     # School name positioning - centered over "School Name" line
@@ -34,7 +69,7 @@ def create_text_overlay(student_name, school_name, date, page_width, page_height
     school_name_x = page_width / 2  # Center horizontally  
     school_name_y = 250  # Position above the "School Name" line
     
-    school_text_width = can.stringWidth(school_name, "Helvetica", 16)
+    school_text_width = _text_width(school_name, "Helvetica", 16)
     can.drawString(school_name_x - school_text_width/2, school_name_y, school_name)
     
     # Date positioning - centered over "Date" line
@@ -43,7 +78,7 @@ def create_text_overlay(student_name, school_name, date, page_width, page_height
     date_x = page_width / 2  # Center horizontally
     date_y = 120  # Position above the "Date" line
     
-    date_text_width = can.stringWidth(date, "Helvetica", 14)
+    date_text_width = _text_width(date, "Helvetica", 14)
     can.drawString(date_x - date_text_width/2, date_y, date)
     
     can.save()
@@ -60,14 +95,11 @@ def test_single_certificate():
     date = "19 November 2025"
     
     try:
-        # Read the template PDF
-        reader = PdfReader(template_path)
-        writer = PdfWriter()
+        # Read the template PDF (parsed once and reused on later calls)
+        reader, page_width, page_height = _get_template(template_path)
         
         # Get the first page
         template_page = reader.pages[0]
-        page_width = float(template_page.mediabox.width)
-        page_height = float(template_page.mediabox.height)
         
         print(f"Page dimensions: {page_width} x {page_height}")
         
@@ -76,12 +108,13 @@ def test_single_certificate():
         overlay_reader = PdfReader(overlay_packet)
         overlay_page = overlay_reader.pages[0]
         
-        # Merge the overlay with the template
-        template_page.merge_page(overlay_page)
-        writer.add_page(template_page)
-        
-        # Write the output PDF
+        # Write the output PDF straight into the open file
         with open(output_path, 'wb') as output_file:
+            writer = PdfWriter()
+            
+            # Stamp the overlay onto the writer's copy of the template page
+            page = writer.add_page(template_page)
+            stamp_overlay(writer, page, overlay_page)
             writer.write(output_file)
             
         print(f"Test certificate generated: {output_path}")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script to check that stamp_overlay keeps a page's own content.
+"""
+
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, IndirectObject
+from reportlab.pdfgen import canvas
+from pathlib import Path
+import io
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from certificate_generator.certificate_generator import stamp_overlay
+
+def _single_page_pdf(text):
+    """Create a one-page PDF whose /Contents is a single stream, as reportlab writes it."""
+    packet = io.BytesIO()
+    can = canvas.Canvas(packet, pagesize=(792, 612))
+    can.drawString(100, 100, text)
+    can.save()
+    packet.seek(0)
+    return PdfReader(packet)
+
+def test_single_stream_contents():
+    """Stamp onto a template whose /Contents is one stream rather than an array."""
+    template_reader = _single_page_pdf("Template text")
+    overlay_reader = _single_page_pdf("Overlay text")
+    assert not isinstance(template_reader.pages[0].raw_get('/Contents'), ArrayObject)
+    
+    writer = PdfWriter()
+    page = writer.add_page(template_reader.pages[0])
+    stamp_overlay(writer, page, overlay_reader.pages[0])
+    output = io.BytesIO()
+    writer.write(output)
+    
+    # Every content stream has to stay an indirect reference to be valid PDF
+    stamped_page = PdfReader(output).pages[0]
+    contents = stamped_page.raw_get('/Contents').get_object()
+    assert all(isinstance(stream, IndirectObject) for stream in contents)
+    
+    text = stamped_page.extract_text()
+    assert "Template text" in text
+    assert "Overlay text" in text
+    print("Template and overlay text both survived stamping")
+
+if __name__ == "__main__":
+    test_single_stream_contents()
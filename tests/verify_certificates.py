@@ -4,35 +4,59 @@ Script to verify certificate generation by checking PDF metadata and content.
 """
 
 from PyPDF2 import PdfReader
+from PyPDF2.generic import ArrayObject
+import argparse
 import os
 
-def check_certificate(file_path):
-    """Check a certificate PDF and display basic information."""
+def check_certificate(file_path, deep=False):
+    """
+    Check a certificate PDF and display basic information.
+    
+    Extracting text interprets the whole content stream, so by default only
+    the page's content streams are counted; pass deep=True for a text preview.
+    """
+    # Collect the report and print it in one go
+    lines = []
     try:
         reader = PdfReader(file_path)
-        print(f"\nChecking: {os.path.basename(file_path)}")
-        print(f"Number of pages: {len(reader.pages)}")
+        lines.append(f"\nChecking: {os.path.basename(file_path)}")
+        lines.append(f"Number of pages: {len(reader.pages)}")
         
         # Get the first page
         page = reader.pages[0]
-        print(f"Page dimensions: {page.mediabox.width} x {page.mediabox.height}")
+        lines.append(f"Page dimensions: {page.mediabox.width} x {page.mediabox.height}")
+        
+        if not deep:
+            contents = page.get('/Contents')
+            contents = contents.get_object() if contents is not None else ArrayObject()
+            stream_count = len(contents) if isinstance(contents, ArrayObject) else 1
+            lines.append(f"Content streams: {stream_count}")
+            return True
         
         # Try to extract some text to verify content
         text = page.extract_text()
         if text:
-            print("Text content preview (first 200 characters):")
-            print(text[:200] + "..." if len(text) > 200 else text)
+            lines.append("Text content preview (first 200 characters):")
+            lines.append(text[:200] + ("..." if len(text) > 200 else ""))
         else:
-            print("No extractable text found (this is normal for image-based PDFs)")
+            lines.append("No extractable text found (this is normal for image-based PDFs)")
             
         return True
         
     except Exception as e:
-        print(f"Error checking {file_path}: {str(e)}")
+        lines.append(f"Error checking {file_path}: {str(e)}")
         return False
+    
+    finally:
+        print("\n".join(lines))
 
 def main():
     """Check a few sample certificates."""
+    parser = argparse.ArgumentParser(description='Check a few generated certificates')
+    parser.add_argument('--deep', action='store_true',
+                       help='Extract and preview each certificate\'s text (slower)')
+    args = parser.parse_args()
+    
     certificates_dir = "certificates"
     
     # Check if certificates directory exists
@@ -40,28 +64,33 @@ def main():
         print(f"Error: {certificates_dir} directory not found!")
         return
     
-    # Get list of certificate files
-    cert_files = [f for f in os.listdir(certificates_dir) if f.endswith('.pdf')]
+    # Scan the directory once, keeping paths only for the sample that is
+    # checked and just counting the rest
+    sample_size = 3
+    cert_files = []
+    total = 0
+    with os.scandir(certificates_dir) as entries:
+        for entry in entries:
+            if entry.name[-4:].lower() == '.pdf':
+                total += 1
+                if len(cert_files) < sample_size:
+                    cert_files.append(entry.path)
     
     if not cert_files:
         print(f"No certificate PDFs found in {certificates_dir}")
         return
     
-    print(f"Found {len(cert_files)} certificate files")
-    
     # Check the first few certificates
-    sample_size = min(3, len(cert_files))
-    print(f"\nChecking first {sample_size} certificates:")
+    print(f"Found {total} certificate files\n\nChecking first {len(cert_files)} certificates:")
     
-    for i in range(sample_size):
-        cert_path = os.path.join(certificates_dir, cert_files[i])
-        check_certificate(cert_path)
+    for cert_path in cert_files:
+        check_certificate(cert_path, deep=args.deep)
     
-    print(f"\nAll {len(cert_files)} certificates have been generated successfully!")
-    print("Each certificate contains:")
-    print("- Student name from the class list")
-    print("- School name: Andrew Jackson Elementary School")
-    print("- Date: 19 November 2025")
+    print(f"\nAll {total} certificates have been generated successfully!\n"
+          "Each certificate contains:\n"
+          "- Student name from the class list\n"
+          "- School name: Andrew Jackson Elementary School\n"
+          "- Date: 19 November 2025")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file